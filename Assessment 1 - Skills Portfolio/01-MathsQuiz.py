@@ -21,7 +21,24 @@ at the end of each quiz session.
 Submitted by: Brent Muli
 """
 
+# Min and max operand values for each difficulty level:
+# single digit, double digit and 4-digit numbers respectively
+DIFFICULTY_RANGES = {
+    "Easy": (1, 9),
+    "Moderate": (10, 99),
+    "Advanced": (1000, 9999),
+}
+
+# Operators a question can use, picked by a single random bit
+_OPS = ('+', '-')
+
 class MathQuiz:
+    # Resized background GIF frames and their durations, shared by every
+    # MathQuiz in this Python process and keyed by (path, modification time)
+    # so an edited file is decoded again. PIL images are cached rather than
+    # PhotoImages because a PhotoImage belongs to the Tk root it was made for.
+    _frame_cache = {}
+
     def __init__(self, root):
         self.root = root
         self.root.title("Math Quiz")
@@ -38,38 +55,45 @@ class MathQuiz:
         # GIF animation variables (frames are stored as PhotoImage objects)
         # `bg_label` will hold the widget that displays the animated GIF.
         self.bg_frames = []
+        self.bg_durations = [] # Display time of each frame in milliseconds
         self.bg_frame_index = 0
         self.bg_label = None
+        # Id of the pending `after` callback for the next animation frame, so
+        # only one animation chain is ever scheduled at a time.
+        self._bg_after_id = None
 
         # Attempt to load an animated background; if Pillow is missing or
         # the file is not found, the loader will fallback to a solid color.
         self._load_animated_background()
         
+        # Pause the background animation while the window is minimised and
+        # resume it when the window is shown again
+        self.root.bind('<Unmap>', self._on_unmap)
+        self.root.bind('<Map>', self._on_map)
+        
+        # Cancel pending callbacks before closing so none fire on destroyed widgets
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         self.score = 0 # Empty score variable
         self.current_question = 0 # Empty current question variable
         self.total_questions = 10 # Total number of questions per quiz
         self.current_difficulty = "" # Empty current difficulty variable
         
-        """Difficulty questions:
-            Each entry in `self.questions` is a list of tuples (question_text, answer).
-            We precompute the numeric answer with `eval()` so checking is a simple
-            integer comparison later. The comprehensions below generate 10
-            sample questions per difficulty using different numeric ranges.
-        """
-        self.questions = {
-            "Easy": [(f"{a} {op} {b}", eval(f"{a}{op}{b}")) for _ in range(10) 
-                for a in [random.randint(1, 9)] 
-                for b in [random.randint(1, 9)]
-                for op in [random.choice(['+', '-'])]],
-            "Moderate": [(f"{a} {op} {b}", eval(f"{a}{op}{b}")) for _ in range(10) 
-                for a in [random.randint(10, 99)] 
-                for b in [random.randint(10, 99)]
-                for op in [random.choice(['+', '-'])]],
-            "Advanced": [(f"{a} {op} {b}", eval(f"{a}{op}{b}")) for _ in range(10) 
-                for a in [random.randint(1000, 9999)] 
-                for b in [random.randint(1000, 9999)]
-                for op in [random.choice(['+', '-'])]]
+        # Question list for the quiz in progress. It is only generated when a
+        # difficulty is played (see `_gen_questions`), so nothing is built at startup.
+        self._active_questions = []
+        self._next_q_after = None # Id of the pending `after` that shows the next question
+        
+        # Each screen's widgets are created once and kept as a list of
+        # (widget, pack options). Changing screen just unpacks the current
+        # widgets and packs the next screen's, instead of destroying and
+        # recreating every widget on each transition.
+        self._screens = {
+            "menu": self._build_menu_screen(),
+            "quiz": self._build_quiz_screen(),
+            "results": self._build_results_screen(),
         }
+        self._current_screen = None
         self.show_main_menu()
     
     def _load_animated_background(self):
@@ -80,23 +104,16 @@ class MathQuiz:
         try:
             # Check if the background image file exists
             if self.bg_image_path.exists():
-                # Open the GIF and get all frames
-                gif_image = Image.open(self.bg_image_path)
-                self.bg_frames = []
+                # Reuse already decoded frames when this file was loaded before
+                cache_key = (str(self.bg_image_path), self.bg_image_path.stat().st_mtime)
+                cached = MathQuiz._frame_cache.get(cache_key)
+                if cached is None:
+                    cached = self._decode_gif_frames()
+                    MathQuiz._frame_cache[cache_key] = cached
+                frames, self.bg_durations = cached
                 
-                # Extract all frames from the GIF
-                try:
-                    frame_count = 0
-                    while True:
-                        # Convert frame to PhotoImage and keep reference
-                        frame = gif_image.copy().resize((500, 400), Image.Resampling.LANCZOS)
-                        photo_frame = ImageTk.PhotoImage(frame)
-                        self.bg_frames.append(photo_frame)
-                        frame_count += 1
-                        gif_image.seek(frame_count)
-                except EOFError:
-                    # Reached end of GIF frames
-                    pass
+                # Convert frames to PhotoImage and keep references
+                self.bg_frames = [ImageTk.PhotoImage(frame) for frame in frames]
                 
                 # Create background label and place it behind other widgets.
                 # Keep a reference to PhotoImage frames on the instance (and
@@ -108,7 +125,10 @@ class MathQuiz:
                 # so interactive controls remain visible on top of it.
                 self.bg_label.lower()
                 
-                # Start animation
+                # Start animation, cancelling any chain left over from an
+                # earlier load so callbacks don't pile up
+                if self._bg_after_id is not None:
+                    self.root.after_cancel(self._bg_after_id)
                 self._animate_background(0)
                 
             else:
@@ -120,92 +140,217 @@ class MathQuiz:
             # Fallback to solid color background
             self.root.configure(bg='#3278b4')
     
+    def _decode_gif_frames(self):
+        """Open the background GIF and return (frames, durations).
+
+        Frames are resized to the window; durations are each frame's delay in
+        milliseconds as stored in the GIF, defaulting to 100ms when missing.
+        """
+        gif_image = Image.open(self.bg_image_path)
+        frames = []
+        durations = []
+        
+        # Extract all frames from the GIF
+        try:
+            frame_count = 0
+            while True:
+                # `convert` already returns a new image, so no `copy()` is
+                # needed. GIF frames are small palette images where BILINEAR
+                # looks the same as the much slower LANCZOS filter.
+                frame = gif_image.convert('RGB')
+                if frame.size != (500, 400):
+                    frame = frame.resize((500, 400), Image.Resampling.BILINEAR)
+                frames.append(frame)
+                durations.append(gif_image.info.get('duration') or 100)
+                frame_count += 1
+                gif_image.seek(frame_count)
+        except EOFError:
+            # Reached end of GIF frames
+            pass
+        return frames, durations
+    
     def _animate_background(self, frame_index):
         """Update the background animation frame"""
-        if hasattr(self, 'bg_label') and self.bg_frames:
+        if self.bg_label is not None and self.bg_frames:
+            # Don't redraw while the window is minimised or hidden; just check
+            # again later in case the <Map> event is never delivered
+            if self.root.state() in ('iconic', 'withdrawn'):
+                self._bg_after_id = self.root.after(500, self._animate_background, frame_index)
+                return
+            
             # Update frame
+            self.bg_frame_index = frame_index
             self.bg_label.configure(image=self.bg_frames[frame_index])
             
             # Calculate next frame index
             next_frame = (frame_index + 1) % len(self.bg_frames)
             
-            # Schedule next frame update (typical GIF delay is 100ms)
-            self.root.after(100, lambda: self._animate_background(next_frame))
-        
-    def show_main_menu(self):
-        self.clear_root() # Clears any existing widgets and ensure background is set
+            # Schedule next frame update after this frame's own GIF delay, so
+            # slow GIFs aren't redrawn more often than they change. `after`
+            # passes extra arguments through, so no lambda is needed per frame.
+            self._bg_after_id = self.root.after(self.bg_durations[frame_index],
+                                                self._animate_background, next_frame)
+    
+    def _on_unmap(self, event):
+        """Stop the background animation when the main window is minimised"""
+        # Child widgets also report <Unmap> through the root's bindings
+        if event.widget is self.root and self._bg_after_id is not None:
+            self.root.after_cancel(self._bg_after_id)
+            self._bg_after_id = None
+    
+    def _on_map(self, event):
+        """Resume the background animation from the last frame shown"""
+        if event.widget is self.root and self._bg_after_id is None and self.bg_frames:
+            self._animate_background(self.bg_frame_index)
         
+    def _build_menu_screen(self):
+        """Create the main menu widgets and return them with their pack options"""
         # Displays the text on the middle top of the main menu screen
         title_label = tk.Label(self.root, text="DIFFICULTY LEVEL", 
                             font=('Comic Sans MS', 20, 'bold'), bg='#3278b4', fg='white', padx=3, pady=2)
-        title_label.pack(pady=30)
         
         # Difficulty buttons, changes the color of the button depending on the difficulty selected
         easy_dif = tk.Button(self.root, text="1. Easy 👍", 
                             font=('Arial', 16), bg='#79ADD9', fg='white',
                             width=15, height=2, command=lambda: self.start_quiz("Easy"))
-        easy_dif.pack(pady=10)
         
         moderate_dif = tk.Button(self.root, text="2. Moderate 📝", 
                             font=('Arial', 16), bg='#266096', fg='white',
                             width=15, height=2, command=lambda: self.start_quiz("Moderate"))
-        moderate_dif.pack(pady=10)
         
         advanced_dif = tk.Button(self.root, text="3. Advanced 🔥", 
                             font=('Arial', 16), bg='#034380', fg='white',
                             width=15, height=2, command=lambda: self.start_quiz("Advanced"))
-        advanced_dif.pack(pady=10)
-        
-    def clear_root(self):  # Remove all widgets from the root and reset background for new screen
-        for widget in self.root.winfo_children():
-            # Don't destroy the background label if it exists
-            if widget != self.bg_label:
-                widget.destroy()
-        
-        # Ensure background is at the bottom
-        if self.bg_label:
-            self.bg_label.lower()
-        
-    def start_quiz(self, difficulty): # Starts the quiz based on selected difficulty
-        self.current_difficulty = difficulty # Set current difficulty
-        self.score = 0 # Resets the score before starting a new quiz
-        self.current_question = 0 # Sets the current question to the first question
         
-        self.clear_root() # Reset UI
+        return [(title_label, {'pady': 30}),
+                (easy_dif, {'pady': 10}),
+                (moderate_dif, {'pady': 10}),
+                (advanced_dif, {'pady': 10})]
         
-        # Quiz widgets
-        self.difficulty_label = tk.Label(self.root, text=f"Difficulty: {difficulty}", # Displays current difficulty on the top middle of the screen
+    def _build_quiz_screen(self):
+        """Create the quiz widgets and return them with their pack options"""
+        self.difficulty_label = tk.Label(self.root, text="", # Displays current difficulty on the top middle of the screen
                                         font=('Comic Sans MS', 20, 'bold'), bg='#3278b4', fg='white', padx=2, pady=1)
-        self.difficulty_label.pack(pady=5)
         
         self.question_label = tk.Label(self.root, text="", font=('Comic Sans MS', 20, 'bold', 'underline'), # Displays the text for the questions
                                     bg='#3278b4', fg='white', wraplength=450, padx=3, pady=2)
-        self.question_label.pack(pady=20)
         
         self.answer_entry = tk.Entry(self.root, font=('Arial', 14), justify='center', width=20) # Entry box for users to input their answers
-        self.answer_entry.pack(pady=10)
         self.answer_entry.bind('<Return>', lambda event: self.check_answer()) # Allows users to press Enter to submit their answer as an alternative to clicking the button
         
         self.feedback_label = tk.Label(self.root, text="", font=('Comic Sans MS', 12), bg='#3278b4', fg='white', padx=2, pady=1) # Displays feedback for correct and incorrect answers
-        self.feedback_label.pack(pady=10)
         
-        self.score_label = tk.Label(self.root, text=f"Score: {self.score}/{self.total_questions}", # Displays the current score to the current question
+        self.score_label = tk.Label(self.root, text="", # Displays the current score to the current question
                                 font=('Comic Sans MS', 12), bg='#3278b4', fg='white', padx=2, pady=1)
-        self.score_label.pack(pady=10)
         
         button_frame = tk.Frame(self.root, bg='') # Frame for the submit button
-        button_frame.pack(pady=10)
         
         self.submit_button = tk.Button(button_frame, text="Submit Answer", # Text for the submit button
                                     command=self.check_answer, # Calls the check_answer method when clicked to check the user's answer
                                     font=('Comic Sans MS', 12), bg='#2196F3', fg='white', padx=20)
         self.submit_button.pack(pady=5)
         
+        return [(self.difficulty_label, {'pady': 5}),
+                (self.question_label, {'pady': 20}),
+                (self.answer_entry, {'pady': 10}),
+                (self.feedback_label, {'pady': 10}),
+                (self.score_label, {'pady': 10}),
+                (button_frame, {'pady': 10})]
+        
+    def _build_results_screen(self):
+        """Create the results widgets and return them with their pack options"""
+        result_label = tk.Label(self.root, text="Quiz Completed!", # Displays "Quiz Completed!" at the middle-top of the results screen
+                            font=('Comic Sans MS', 20, 'bold'), bg='#3278b4', fg='white', padx=3, pady=2)
+        
+        self.final_score_label = tk.Label(self.root, text="", # Displays the final score at the results screen
+                            font=('Comic Sans MS', 16), bg='#3278b4', fg='white', padx=2, pady=1)
+        
+        self.performance_label = tk.Label(self.root, text="", # Displays the performance message chosen in show_results
+                                font=('Comic Sans MS', 18, 'bold'), bg='#3278b4', padx=3, pady=2)
+        
+        # Buttons format
+        button_frame = tk.Frame(self.root, bg='') 
+        
+        play_again_button = tk.Button(button_frame, text="Play Again?", # Gives option to play the quiz again
+                                command=lambda: self.start_quiz(self.current_difficulty),
+                                font=('Arial', 12), bg='#2196F3', fg='white', padx=20)
+        play_again_button.pack(side=tk.LEFT, padx=10)
+        
+        menu_button = tk.Button(button_frame, text="Main Menu", # Gives option to return to the main menu to change difficulty
+                            command=self.show_main_menu,
+                            font=('Arial', 12), bg='#757575', fg='white', padx=20)
+        menu_button.pack(side=tk.LEFT, padx=10)
+        
+        return [(result_label, {'pady': 20}),
+                (self.final_score_label, {'pady': 10}),
+                (self.performance_label, {'pady': 10}),
+                (button_frame, {'pady': 20})]
+        
+    def show_screen(self, name):  # Hide the current screen's widgets and show the named screen
+        if self._current_screen is not None:
+            for widget, _ in self._screens[self._current_screen]:
+                widget.pack_forget()
+        
+        for widget, pack_options in self._screens[name]:
+            widget.pack(**pack_options)
+        self._current_screen = name
+        
+        # Hidden widgets keep keyboard focus, so hand it back to the window
+        # (e.g. so Enter in the hidden answer box can't submit from the results screen)
+        self.root.focus_set()
+        
+        # Ensure background is at the bottom
+        if self.bg_label is not None:
+            self.bg_label.lower()
+        
+    def _on_close(self):
+        """Cancel any scheduled callbacks, then close the window"""
+        for after_id in (self._next_q_after, self._bg_after_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self.root.destroy()
+        
+    def show_main_menu(self):
+        self.show_screen("menu")
+        
+    def start_quiz(self, difficulty): # Starts the quiz based on selected difficulty
+        self.current_difficulty = difficulty # Set current difficulty
+        self.score = 0 # Resets the score before starting a new quiz
+        self.current_question = 0 # Sets the current question to the first question
+        
+        # Generate a fresh set of questions for this play of the chosen difficulty
+        self._active_questions = self._gen_questions(difficulty)
+        
+        # Refresh the quiz screen's labels for this play
+        self.difficulty_label.config(text=f"Difficulty: {difficulty}")
+        self.score_label.config(text=f"Score: {self.score}/{self.total_questions}")
+        self.show_screen("quiz")
+        
         self.display_question() # Displays the first question and set up for the quiz screen
         
+    def _gen_questions(self, difficulty, count=None):
+        """Generate the questions for one play of the given difficulty.
+
+        Returns a list of `count` tuples (question_text, answer), defaulting to
+        `self.total_questions`. The numeric answer is precomputed directly so
+        checking is a simple integer comparison later. Every operand is drawn
+        in one `random.choices` call and every operator comes from one bit of
+        a single `random.getrandbits` call, so larger quizzes only grow the
+        single formatting pass below.
+        """
+        if count is None:
+            count = self.total_questions
+        low, high = DIFFICULTY_RANGES[difficulty]
+        operands = random.choices(range(low, high + 1), k=2 * count)
+        op_bits = random.getrandbits(count) # Bit i selects the operator for question i
+        return [(f"{a} {op} {b}", a + b if op == '+' else a - b)
+                for i, (a, b) in enumerate(zip(operands[::2], operands[1::2]))
+                for op in [_OPS[op_bits >> i & 1]]]
+        
     def display_question(self): # Displays the current question based on the current question index from the selected difficulty
+        self._next_q_after = None # The scheduled call (if any) has now run
         if self.current_question < self.total_questions: # Checks if there are remaining questions
-            question_text, self.correct_answer = self.questions[self.current_difficulty][self.current_question] # Retrieves the question text as well as the correct answer
+            question_text, self.correct_answer = self._active_questions[self.current_question] # Retrieves the question text as well as the correct answer
             self.question_label.config(text=question_text) # Updates the current question label with the new question text
             self.answer_entry.delete(0, tk.END) # Clears the answer entry box for new input
             self.feedback_label.config(text="") # Clears previous feedback text
@@ -216,17 +361,21 @@ class MathQuiz:
             self.show_results() # If there are no remaining questions, shows the results screen
             
     def check_answer(self): # Checks the user's answer from the entry box against the correct answer
-        user_answer = self.answer_entry.get() 
+        if self._next_q_after is not None: # This answer is already marked and the next question is on its way
+            return # Ignore repeat presses so it isn't scored twice (and only one `after` is ever pending)
         
-        try:
-            if int(user_answer) == self.correct_answer: # Compares the user's answer to the correct answer
-                self.score += 1 # If correct, increments the score by 1
-                self.feedback_label.config(text="✓ Correct!", fg="#B7FF30") # Displays the correct feedback
-            else:
-                self.feedback_label.config(text=f"✗ Wrong! The answer is {self.correct_answer}", fg="red") # Displays the incorrect feedback
-        except ValueError:
+        user_answer = self.answer_entry.get().strip()
+        
+        # Validate the input up front instead of relying on int() raising ValueError
+        if not user_answer.removeprefix('-').isdecimal():
             self.feedback_label.config(text="Please enter a valid number.", fg="red") # Prompts user to enter a valid number if input is invalid(i.e., non-numeric)
             return # Exit the method if input is invalid
+        
+        if int(user_answer) == self.correct_answer: # Compares the user's answer to the correct answer
+            self.score += 1 # If correct, increments the score by 1
+            self.feedback_label.config(text="✓ Correct!", fg="#B7FF30") # Displays the correct feedback
+        else:
+            self.feedback_label.config(text=f"✗ Wrong! The answer is {self.correct_answer}", fg="red") # Displays the incorrect feedback
             
         self.score_label.config(text=f"Score: {self.score}/{self.total_questions}") # Updates the score label after each question
         self.current_question += 1 # Increase the current question index
@@ -234,20 +383,12 @@ class MathQuiz:
         # Short delay before showing the next question so the feedback is
         # visible briefly. `after` queues the callback on the Tk main loop
         # and does not block the UI thread.
-        self.root.after(200, self.display_question)
+        self._next_q_after = self.root.after(200, self.display_question)
             
     def show_results(self):
-        self.clear_root() # Clear UI and prepare results when quiz is completed
-
         percentage = (self.score / self.total_questions) * 100 # Calculate the percentage score for the results screen
 
-        result_label = tk.Label(self.root, text="Quiz Completed!", # Displays "Quiz Completed!" at the middle-top of the results screen
-                            font=('Comic Sans MS', 20, 'bold'), bg='#3278b4', fg='white', padx=3, pady=2)
-        result_label.pack(pady=20)
-        
-        score_label = tk.Label(self.root, text=f"Final Score: {self.score}/{self.total_questions}", # Displays the final score at the results screen
-                            font=('Comic Sans MS', 16), bg='#3278b4', fg='white', padx=2, pady=1)
-        score_label.pack(pady=10)
+        self.final_score_label.config(text=f"Final Score: {self.score}/{self.total_questions}") # Displays the final score at the results screen
         
     # Displays a message based on the user's performance of the quiz at the "Results Screen"
         if percentage == 100:
@@ -263,23 +404,9 @@ class MathQuiz:
             performance = "Nice try! Keep practicing!"
             color = "#f44336"
         
-        performance_label = tk.Label(self.root, text=performance, # Displays performance message displayed above
-                                font=('Comic Sans MS', 18, 'bold'), bg='#3278b4', fg=color, padx=3, pady=2)
-        performance_label.pack(pady=10)
-        
-        # Buttons format
-        button_frame = tk.Frame(self.root, bg='') 
-        button_frame.pack(pady=20)
+        self.performance_label.config(text=performance, fg=color) # Displays performance message chosen above
         
-        play_again_button = tk.Button(button_frame, text="Play Again?", # Gives option to play the quiz again
-                                command=lambda: self.start_quiz(self.current_difficulty),
-                                font=('Arial', 12), bg='#2196F3', fg='white', padx=20)
-        play_again_button.pack(side=tk.LEFT, padx=10)
-        
-        menu_button = tk.Button(button_frame, text="Main Menu", # Gives option to return to the main menu to change difficulty
-                            command=self.show_main_menu,
-                            font=('Arial', 12), bg='#757575', fg='white', padx=20)
-        menu_button.pack(side=tk.LEFT, padx=10)
+        self.show_screen("results") # Switch to the results screen when quiz is completed
 
 if __name__ == "__main__":
     root = tk.Tk()
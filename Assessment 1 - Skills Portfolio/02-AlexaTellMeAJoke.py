@@ -1,11 +1,13 @@
 from tkinter import *
+from tkinter import font as tkfont
 from pathlib import Path
 import random
 import threading
-# Try to import pygame for audio playback; gracefully degrade if not available
+# Try to import pygame for audio playback; gracefully degrade if not available.
+# The mixer itself is initialised on the first laugh (see `_play_laugh_sound`)
+# so probing the audio device doesn't slow down startup.
 try:
     import pygame
-    pygame.mixer.init()
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
@@ -43,20 +45,48 @@ class AlexaJokeApp:
         self.resource_dir = Path(__file__).resolve().parent / "A1 - Resources"
         self.laugh_audio = self.resource_dir / "laughsfx.mp3"
         self.laugh_image = self.resource_dir / "laugh.png"
+        # Decode and shrink the laugh image once; every punchline fade-in
+        # works from this copy instead of re-reading the PNG from disk
+        self._laugh_img = self._load_laugh_image()
+        # pygame Sound for the laugh, decoded on first use by `_play_laugh_sound`
+        self._laugh_sound = None
+        # Set once the mixer or the clip fails to load, so later punchlines
+        # don't retry (and re-report) the same failure on every click
+        self._laugh_failed = False
+        # Background thread that loads and plays the first laugh. Only one is
+        # ever started (not one per click); it is a daemon so a hung audio
+        # device can't keep the process alive after the window closes
+        self._laugh_thread = None
+        # PhotoImage frames for the laugh image fade-in, built on the first
+        # punchline and reused afterwards, plus the fade's playback state
+        self._fade_frames = None
+        self._fade_index = 0
+        self._fade_after_id = None
 
-        # Current selected index (starts random)
-        self.current_joke_index = random.randint(0, max(len(self.joke_list) - 1, 0))
+        # Shuffle the joke order once and step through it with a cursor, so
+        # no joke repeats until every joke has been told
+        self._joke_order = random.sample(range(len(self.joke_list)), len(self.joke_list))
+        self._joke_cursor = 0
+        # Current selected index (starts at the first shuffled joke)
+        self.current_joke_index = self._joke_order[0] if self._joke_order else 0
         # Track whether punchline has been shown for current joke
         self.punchline_shown = False
         # Track whether joke has been displayed (needed before showing punchline)
         # This ensures the user must click "Alexa tell me a joke" before showing punchline
         self.joke_displayed = False
 
+        # One shared font object for every label and button. The bare numbers
+        # these widgets used to pass as `font=` were read by Tk as unknown
+        # family names, so all text already rendered in the default font;
+        # reusing a single Font keeps that look without Tk resolving a
+        # separate font spec for every widget.
+        self.ui_font = tkfont.nametofont("TkDefaultFont")
+
         # UI widgets stored as instance attributes
-        self.joke_label = Label(self.root, text="", font=20, bg='#FFE86B')
+        self.joke_label = Label(self.root, text="", font=self.ui_font, bg='#FFE86B')
         self.joke_label.pack(pady=25)
 
-        self.punchline_label = Label(self.root, text="", font=20, bg='#FFE86B')
+        self.punchline_label = Label(self.root, text="", font=self.ui_font, bg='#FFE86B')
         self.punchline_label.pack()
 
         # Button frame with yellow background
@@ -65,22 +95,22 @@ class AlexaJokeApp:
 
         # Buttons trigger instance methods with darker yellow background and spacing
         self.joke_button = Button(self.buttons, text="Alexa tell me a joke",
-                                command=self.display_joke, font=40,
+                                command=self.display_joke, font=self.ui_font,
                                 bg='#FCD217', fg='black')
         self.joke_button.pack(side=LEFT, padx=10)
 
         self.punchline_button = Button(self.buttons, text="Show punchline",
-                                    command=self.show_punchline, font=40,
+                                    command=self.show_punchline, font=self.ui_font,
                                     bg='#FCD217', fg='black')
         self.punchline_button.pack(side=RIGHT, padx=10)
 
         self.next_button = Button(self.root, text="Next joke",
-                                command=self.next_joke, font=30,
+                                command=self.next_joke, font=self.ui_font,
                                 bg='#FCD217', fg='black')
         self.next_button.pack(pady=10)
 
         # Message label below Next joke button (shows in red)
-        self.message_label = Label(self.root, text="", font=12, fg='black', bg='#FFE86B')
+        self.message_label = Label(self.root, text="", font=self.ui_font, fg='black', bg='#FFE86B')
         self.message_label.pack()
 
         # Laugh image label (overlay for fade effect)
@@ -106,26 +136,44 @@ class AlexaJokeApp:
         punchline_list = []
 
         try:
+            # Iterate the file line by line rather than reading it into one
+            # big string first
             with txt_path.open('r', encoding='utf-8') as file:
-                txt_content = file.read()
+                self._parse_jokes(file, joke_list, punchline_list)
         except FileNotFoundError:
             # If the file is missing, provide a tiny fallback so the UI still works
-            txt_content = "Why did the chicken cross the road?To get to the other side"
+            self._parse_jokes(["Why did the chicken cross the road?To get to the other side"],
+                              joke_list, punchline_list)
 
-        for line in txt_content.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # Split on the first '?' to allow '?' inside punchlines
-            if '?' in line:
-                joke_text, punchline_text = line.split('?', 1)
-                joke_list.append(joke_text + "?")
-                punchline_list.append(punchline_text)
-            else:
-                # Skip malformed line but continue loading others
+        return joke_list, punchline_list
+
+    def _parse_jokes(self, lines, joke_list, punchline_list):
+        """Split each line into a joke and punchline, appending to the lists."""
+        for line in lines:
+            # Partition on the first '?' to allow '?' inside punchlines; an
+            # empty separator means the line has no '?' (or is blank), so
+            # the malformed line is skipped but the others still load
+            joke_text, sep, punchline_text = line.strip().partition('?')
+            if not sep:
                 continue
+            joke_list.append(joke_text + "?")
+            punchline_list.append(punchline_text)
 
-        return joke_list, punchline_list
+    def _load_laugh_image(self):
+        """Open `laugh.png` and resize it to fit nicely in the UI.
+
+        Returns None if PIL is unavailable or the image can't be loaded, in
+        which case punchlines are shown without the image.
+        """
+        if not PIL_AVAILABLE or not self.laugh_image.exists():
+            return None
+        try:
+            img = Image.open(str(self.laugh_image))
+            img.thumbnail((200, 200), Image.Resampling.LANCZOS)
+            return img
+        except Exception as e:
+            print(f"Error loading laugh image: {e}")
+            return None
 
     def display_joke(self):
         """Display the current joke text (without punchline)."""
@@ -158,73 +206,128 @@ class AlexaJokeApp:
         self.punchline_shown = True
         self.message_label.config(text="Press 'Next joke' to continue the silliness!")
         
-        # Play laugh sound in a separate thread to avoid blocking UI
-        # Only attempt if pygame is available and the audio file exists
-        if PYGAME_AVAILABLE and self.laugh_audio.exists():
-            threading.Thread(target=self._play_laugh_sound, daemon=True).start()
+        # Play laugh sound. Once the clip is loaded, `play()` returns straight
+        # away, so only the first laugh (which initialises the mixer and
+        # decodes the file) runs on a background thread to avoid blocking UI
+        # Only attempt if pygame is available, the audio file exists and the
+        # first load has not already been started (or failed)
+        if self._laugh_sound is not None:
+            # Restart the laugh rather than layering another copy over it
+            self._laugh_sound.stop()
+            self._laugh_sound.play()
+        elif (PYGAME_AVAILABLE and not self._laugh_failed and self._laugh_thread is None
+                and self.laugh_audio.exists()):
+            self._laugh_thread = threading.Thread(target=self._play_laugh_sound, daemon=True)
+            self._laugh_thread.start()
         
         # Display and fade in the laugh image
-        # Only attempt if PIL is available and the image file exists
-        if PIL_AVAILABLE and self.laugh_image.exists():
-            threading.Thread(target=self._fade_in_laugh_image, daemon=True).start()
+        # Only attempt if the image was loaded at startup
+        if self._laugh_img is not None:
+            self._fade_in_laugh_image()
 
     def _play_laugh_sound(self):
-        """Play the laugh sound effect using pygame mixer.
+        """Load and play the laugh sound effect using pygame mixer.
         
-        Runs on a separate thread to keep UI responsive.
+        Runs on a background thread for the first laugh to keep UI responsive;
+        later laughs replay the loaded Sound directly from `show_punchline`.
         Gracefully handles errors if pygame is unavailable or file is missing.
         """
         try:
-            # Load the audio file and play it
-            pygame.mixer.music.load(str(self.laugh_audio))
-            pygame.mixer.music.play()
+            # Initialise the audio device and decode the clip into a Sound the
+            # first time a laugh is played; later punchlines just replay it
+            if self._laugh_sound is None:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                self._laugh_sound = pygame.mixer.Sound(str(self.laugh_audio))
+            self._laugh_sound.stop()
+            self._laugh_sound.play()
         except Exception as e:
-            # Silently fail if audio playback is not available
+            # Silently fail if audio playback is not available; a failed load
+            # is remembered so the punchlines that follow stay silent
+            if self._laugh_sound is None:
+                self._laugh_failed = True
             print(f"Error playing laugh sound: {e}")
 
     def _fade_in_laugh_image(self):
-        """Load and fade in the laugh image with opacity animation.
+        """Fade in the laugh image with opacity animation.
         
-        Runs on a separate thread to keep UI responsive.
-        Gradually increases image opacity from 0 to 255 for a smooth fade effect.
+        The frames are prepared once and then shown one at a time by
+        `root.after` callbacks, so all Tk calls stay on the main thread and
+        the UI remains responsive between frames.
         """
+        # Frames are built on the first punchline only; later punchlines
+        # reuse them
         try:
-            # Load image and resize it to fit nicely in the UI
-            img = Image.open(str(self.laugh_image))
-            img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-            
-            # Fade in effect: gradually increase opacity from 0 to 255
-            # Step by 15 for ~17 frames over ~500ms for smooth animation
-            for alpha in range(0, 256, 15):
-                # Create a copy with adjusted alpha (transparency) level
-                img_with_alpha = img.copy()
-                img_with_alpha.putalpha(alpha)
-                # Convert to PhotoImage for tkinter display
-                photo = ImageTk.PhotoImage(img_with_alpha)
-                
-                # Update label with new image
-                self.laugh_image_label.config(image=photo)
-                # Keep a reference to prevent garbage collection
-                self.laugh_image_label.image = photo
-                # Force UI refresh
-                self.root.update()
-                
-                # Small delay between frames (30ms) for smooth fade animation
-                self.root.after(30)
+            if self._fade_frames is None:
+                self._fade_frames = self._build_fade_frames()
         except Exception as e:
-            # Silently fail if image display is not available
+            # Silently fail if image display is not available, and forget the
+            # image so later punchlines don't retry (and fail) every time
             print(f"Error displaying laugh image: {e}")
+            self._laugh_img = None
+            return
+        
+        # Restart from the first frame if a previous fade is still running
+        self._cancel_fade()
+        self._fade_index = 0
+        self._step_fade()
+
+    def _build_fade_frames(self):
+        """Return the PhotoImage frames for the fade, from transparent to opaque."""
+        frames = []
+        # Split the colour bands once; each frame then only merges them with
+        # a new constant alpha band instead of copying the whole image and
+        # overwriting its alpha channel
+        red, green, blue = self._laugh_img.convert('RGB').split()
+        # Fade in effect: gradually increase opacity from 0 to 255
+        # Step by 15 for ~17 frames over ~500ms for smooth animation
+        for alpha in range(0, 256, 15):
+            alpha_band = Image.new('L', self._laugh_img.size, alpha)
+            img_with_alpha = Image.merge('RGBA', (red, green, blue, alpha_band))
+            # Convert to PhotoImage for tkinter display
+            frames.append(ImageTk.PhotoImage(img_with_alpha))
+        return frames
+
+    def _step_fade(self):
+        """Show the next fade frame and schedule the one after it."""
+        photo = self._fade_frames[self._fade_index]
+        # Update label with new image
+        self.laugh_image_label.config(image=photo)
+        # Keep a reference to prevent garbage collection
+        self.laugh_image_label.image = photo
+        
+        self._fade_index += 1
+        if self._fade_index < len(self._fade_frames):
+            # Small delay between frames (30ms) for smooth fade animation
+            self._fade_after_id = self.root.after(30, self._step_fade)
+        else:
+            self._fade_after_id = None
+
+    def _cancel_fade(self):
+        """Stop a fade-in that is still in progress."""
+        if self._fade_after_id is not None:
+            self.root.after_cancel(self._fade_after_id)
+            self._fade_after_id = None
 
     def next_joke(self):
         """Choose a new random joke and clear the displayed text."""
         if not self.joke_list:
             return
-        # Choose a valid random index (fix off-by-one from original)
-        self.current_joke_index = random.randint(0, len(self.joke_list) - 1)
+        # Move to the next joke in the shuffled order, reshuffling once
+        # every joke has been shown
+        self._joke_cursor = (self._joke_cursor + 1) % len(self._joke_order)
+        if self._joke_cursor == 0:
+            random.shuffle(self._joke_order)
+            # Don't let the new round open with the joke that was just told
+            if self._joke_order[0] == self.current_joke_index and len(self._joke_order) > 1:
+                swap = random.randrange(1, len(self._joke_order))
+                self._joke_order[0], self._joke_order[swap] = self._joke_order[swap], self._joke_order[0]
+        self.current_joke_index = self._joke_order[self._joke_cursor]
         # Clear all displayed content
         self.joke_label.config(text="")
         self.punchline_label.config(text="")
         # Clear the laugh image when moving to next joke
+        self._cancel_fade()
         self.laugh_image_label.config(image="")
         self.laugh_image_label.image = None
         # Reset all flags for the new joke cycle
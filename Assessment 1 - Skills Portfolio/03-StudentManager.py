@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import os
+import csv
+import itertools
+import bisect
+import operator
 from pathlib import Path
 
 """
@@ -13,8 +17,79 @@ script and falls back to a recursive search for filenames matching
 
 Submitted By: Brent Muli
 """
+
+# Key functions for comparing students; attrgetter runs in C, unlike a lambda
+BY_TOTAL = operator.attrgetter('total')
+BY_PERCENTAGE = operator.attrgetter('percentage')
+
+# Grade boundaries (inclusive lower bounds) and the grade for each band:
+# under 40% is 'F', 40-49% 'D', 50-59% 'C', 60-69% 'B' and 70%+ 'A'
+GRADE_BOUNDARIES = (40, 50, 60, 70)
+GRADES = ('F', 'D', 'C', 'B', 'A')
+
+def get_grade(percentage):
+    """Determine grade based on percentage"""
+    # bisect_right counts how many boundaries the percentage has reached,
+    # which is the index of its grade
+    return GRADES[bisect.bisect_right(GRADE_BOUNDARIES, percentage)]
+
+class Student:
+    """A single student record.
+
+    Uses __slots__ instead of a per-record dict, so each record is smaller
+    and attribute access is a fixed slot lookup. Totals, percentage and
+    grade are cached on the record by `refresh_totals`, and the formatted
+    display text is cached in `info` the first time it is shown.
+    """
+    __slots__ = ('code', 'name', 'mark1', 'mark2', 'mark3', 'exam_mark',
+                 'total_coursework', 'total', 'percentage', 'grade', 'info')
+
+    def __init__(self, code, name, mark1, mark2, mark3, exam_mark):
+        self.code = code
+        self.name = name
+        # Three coursework marks (each out of 20) and the exam mark (out of 100)
+        self.mark1 = mark1
+        self.mark2 = mark2
+        self.mark3 = mark3
+        self.exam_mark = exam_mark
+        self.refresh_totals()
+
+    def refresh_totals(self):
+        """Recalculate the cached totals, percentage and grade.
+
+        Must be called whenever any field changes, as it also clears the
+        cached display text.
+        """
+        # Coursework is out of 60 (3 items) and exam out of 100 -> total 160
+        self.total_coursework = self.mark1 + self.mark2 + self.mark3
+        self.total = self.total_coursework + self.exam_mark
+        # x / 160 * 100 folded into one multiply (100 / 160 == 0.625)
+        self.percentage = self.total * 0.625
+        self.grade = get_grade(self.percentage)
+        self.info = None
+
 class StudentManager:
     # Main application class for the student marks GUI
+
+    # Expected locations of the data file relative to this script, most
+    # likely first. We try a few candidate paths to be resilient to working
+    # directory changes and capitalization differences on Windows. Built once
+    # when the class is defined rather than on every load.
+    SCRIPT_DIR = Path(__file__).resolve().parent
+    DATA_FILE_CANDIDATES = (
+        SCRIPT_DIR / "A1 - Resources" / "studentMarks.txt",
+        SCRIPT_DIR / "A1 - Resources" / "studentmarks.txt",
+        SCRIPT_DIR / "studentMarks.txt",
+        SCRIPT_DIR.parent / "A1 - Resources" / "studentMarks.txt",
+    )
+    # Fallback pattern for a recursive search under the script directory
+    DATA_FILE_PATTERN = "*student*mark*.txt"
+    # Unsaved updates are appended to "<data file>.journal" and folded back
+    # into the data file (compacted) on save, on close or after this many
+    JOURNAL_COMPACT_OPS = 500
+    # How long a status bar message stays up before it is cleared (ms)
+    STATUS_CLEAR_MS = 3000
+
     def __init__(self, root):
         self.root = root
         self.root.title("Student Marks Manager")
@@ -22,40 +97,38 @@ class StudentManager:
         self.root.resizable(False, False)  # Prevent window resizing for consistent layout
         # Store the data file path for saving
         self.data_file = None
-        # In-memory list of student records (populated by load_data)
+        # In-memory list of Student records (populated by load_data)
         self.students = []
+        # Maps each student code to its index in self.students, so lookups
+        # by code don't have to scan the whole list
+        self._code_index = {}
+        # True when records have been edited in memory but not yet written
+        # back to the data file (flushed by the Save button or on close)
+        self.dirty = False
+        # Open journal file (opened on first update) and the number of
+        # updates it holds since the data file was last written
+        self._journal = None
+        self._journal_ops = 0
+        # Pending after() id that clears the status bar, if any
+        self._status_after = None
         self.load_data()
         self.create_widgets()
+        # Write any unsaved edits before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def load_data(self):
         """Load student data from file"""
-        # Determine expected locations relative to this script.
-        # We try a few likely candidate paths to be resilient to working
-        # directory changes and capitalization differences on Windows.
-        script_dir = Path(__file__).resolve().parent
-        candidates = [
-            script_dir / "A1 - Resources" / "studentMarks.txt",
-            script_dir / "A1 - Resources" / "studentmarks.txt",
-            script_dir / "studentMarks.txt",
-            script_dir.parent / "A1 - Resources" / "studentMarks.txt",
-        ]
-
-        found = None
-        for p in candidates:
-            if p.exists():
-                found = p
-                break
+        # Use the first candidate that exists, stopping at the first hit
+        found = next((p for p in self.DATA_FILE_CANDIDATES if p.exists()), None)
 
         # Fallback: search for any file matching *student*mark*.txt under script dir
         if found is None:
-            for p in script_dir.rglob("*student*mark*.txt"):
-                found = p
-                break
+            found = next(self.SCRIPT_DIR.rglob(self.DATA_FILE_PATTERN), None)
 
         if found is None:
             # If no file found, ask user to select one
             found = filedialog.askopenfilename(
-                initialdir=script_dir,
+                initialdir=self.SCRIPT_DIR,
                 title="Select student marks file",
                 filetypes=(("Text files", "*.txt"), ("All files", "*.*"))
             )
@@ -67,31 +140,118 @@ class StudentManager:
         self.data_file = found
         
         try:
-            with open(found, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            # `newline=''` is what the csv module expects for files it reads
+            with open(found, 'r', encoding='utf-8', newline='') as file:
+                # csv.reader splits each line as the file is iterated, rather
+                # than reading every line into a list first. QUOTE_NONE keeps
+                # '"' as an ordinary character, since save_data writes names
+                # unquoted (a stray quote must not swallow the following lines)
+                reader = csv.reader(file, quoting=csv.QUOTE_NONE)
+                first = next(reader, None)
                 # Skip first line if it contains a numeric count; otherwise start at first record
-                start_index = 1 if len(lines) > 0 and lines[0].strip().isdigit() else 0
-                for line in lines[start_index:]:
-                    data = line.strip().split(',')
+                if first is not None and len(first) == 1 and first[0].strip().isdigit():
+                    rows = reader
+                else:
+                    rows = itertools.chain([first] if first is not None else [], reader)
+                for data in rows:
                     # Expecting 6 fields per line: code,name,course1,course2,course3,exam
                     if len(data) == 6:
                         try:
-                            code = int(data[0])
-                            name = data[1]
-                            course_marks = [int(data[2]), int(data[3]), int(data[4])]
-                            exam_mark = int(data[5])
+                            # Convert the five numeric fields in one pass
+                            code, mark1, mark2, mark3, exam_mark = map(int, (data[0], *data[2:]))
                         except ValueError:
                             # Skip malformed lines rather than crashing the app
                             continue
-                        self.students.append({
-                            'code': code,
-                            'name': name,
-                            'course_marks': course_marks,
-                            'exam_mark': exam_mark
-                        })
+                        self.students.append(Student(code, data[1], mark1, mark2, mark3, exam_mark))
         except Exception as e:
             # Show a friendly error message if reading fails for any reason
             messagebox.showerror("Error", f"Failed reading {found}: {e}")
+        
+        self._rebuild_code_index()
+        # Re-apply updates that were journaled but never saved to the file
+        self._replay_journal()
+    
+    def _rebuild_code_index(self, start=0):
+        """Re-index student codes from position `start` to the end of the list
+
+        If a code appears more than once, the first record with it wins (as
+        a linear search would find). Entries for positions before `start`
+        must already be correct.
+        """
+        if start == 0:
+            self._code_index.clear()
+        index = self._code_index
+        for i in range(start, len(self.students)):
+            code = self.students[i].code
+            # Keep an earlier record with this code; otherwise point it here
+            # (covers new codes and entries left pointing past a removed record)
+            if index.get(code, i) >= i:
+                index[code] = i
+    
+    def _journal_path(self):
+        """Path of the update journal kept next to the data file"""
+        return self.data_file.with_name(self.data_file.name + ".journal")
+    
+    def _replay_journal(self):
+        """Apply any updates left in the journal on top of the loaded records"""
+        journal_path = self._journal_path()
+        if not journal_path.exists():
+            return
+        
+        try:
+            with open(journal_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    # U<TAB>old code<TAB>new code<TAB>mark1<TAB>mark2<TAB>mark3<TAB>exam<TAB>name
+                    fields = line.rstrip('\n').split('\t', 7)
+                    if len(fields) != 8 or fields[0] != 'U':
+                        continue
+                    try:
+                        old_code, new_code, mark1, mark2, mark3, exam = map(int, fields[1:7])
+                    except ValueError:
+                        # Skip a damaged entry (e.g. a half-written last line)
+                        continue
+                    found_index = self._code_index.get(old_code)
+                    # Skip entries for students that are gone, or whose new
+                    # code now belongs to someone else (e.g. an add, delete or
+                    # sort that never reached the file changed the roster)
+                    if (found_index is not None
+                            and self._code_index.get(new_code, found_index) == found_index):
+                        self._set_student(found_index, new_code, fields[7], mark1, mark2, mark3, exam)
+                        self._journal_ops += 1
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed reading {journal_path}: {e}")
+        
+        # Replayed updates are still only in the journal, not the data file
+        self.dirty = self._journal_ops > 0
+    
+    def _journal_update(self, old_code, student):
+        """Append an update to the journal so it survives until the next save"""
+        try:
+            if self._journal is None:
+                self._journal = open(self._journal_path(), 'a', encoding='utf-8')
+            # One short line per update, flushed straight away so it is not
+            # lost if the app is killed before the next save
+            self._journal.write(f"U\t{old_code}\t{student.code}\t{student.mark1}\t{student.mark2}\t"
+                                f"{student.mark3}\t{student.exam_mark}\t{student.name}\n")
+            self._journal.flush()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to write journal: {e}")
+            return
+        
+        self._journal_ops += 1
+        # Compact: fold the journal back into the data file once it grows large
+        if self._journal_ops >= self.JOURNAL_COMPACT_OPS:
+            self.save_data()
+    
+    def _clear_journal(self):
+        """Close and delete the journal once the data file is up to date"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        # No data file means no journal was ever written
+        if self.data_file:
+            self._journal_path().unlink(missing_ok=True)
+        self._journal_ops = 0
     
     def save_data(self):
         """Save student data back to the original file"""
@@ -100,37 +260,60 @@ class StudentManager:
             return False
         
         try:
+            # Build the whole file in memory first so it is written in one call
+            # Write the count as first line (for file format compatibility)
+            lines = [f"{len(self.students)}\n"]
+            # Write each student as comma-separated values on a new line
+            lines.extend(f"{student.code},{student.name},{student.mark1},{student.mark2},{student.mark3},{student.exam_mark}\n"
+                        for student in self.students)
             with open(self.data_file, 'w', encoding='utf-8') as file:
-                # Write the count as first line (for file format compatibility)
-                file.write(f"{len(self.students)}\n")
-                # Write each student as comma-separated values on a new line
-                for student in self.students:
-                    file.write(f"{student['code']},{student['name']},{student['course_marks'][0]},{student['course_marks'][1]},{student['course_marks'][2]},{student['exam_mark']}\n")
+                file.write("".join(lines))
+                # Flush and sync once, after the single write, so the edit is
+                # actually on disk before success is reported
+                file.flush()
+                os.fsync(file.fileno())
+            # Every journaled update is now in the data file
+            self._clear_journal()
+            self.dirty = False
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
             return False
     
-    def calculate_percentage(self, student):
-        """Calculate overall percentage"""
-        # Coursework is out of 60 (3 items) and exam out of 100 -> total 160
-        total_coursework = sum(student['course_marks'])
-        total_marks = total_coursework + student['exam_mark']
-        return (total_marks / 160) * 100
+    def save_to_file(self):
+        """Write any unsaved edits to the data file (Save button)"""
+        if not self.dirty:
+            messagebox.showinfo("Info", "There are no unsaved changes.")
+            return
+        def on_saved(saved):
+            if saved:
+                self.show_status("File has been updated successfully.")
+        self.save_data_async(on_saved)
     
-    def get_grade(self, percentage):
-        """Determine grade based on percentage"""
-        # Grade boundaries (inclusive lower bounds)
-        if percentage >= 70:
-            return 'A'
-        elif percentage >= 60:
-            return 'B'
-        elif percentage >= 50:
-            return 'C'
-        elif percentage >= 40:
-            return 'D'
-        else:
-            return 'F'
+    def save_data_async(self, callback):
+        """Call save_data once Tk is idle, then pass its result to `callback`"""
+        # Deferring the write lets Tk finish redrawing first (e.g. a form
+        # window that was just closed) instead of freezing part-way through
+        self.root.after_idle(lambda: callback(self.save_data()))
+    
+    def _on_close(self):
+        """Save unsaved edits, then close the window"""
+        if self.dirty and not self.save_data():
+            # Saving failed (the error was already shown); let the user
+            # choose whether to close anyway and discard the edits
+            if not messagebox.askyesno("Unsaved Changes", "Changes could not be saved. Close anyway and discard them?"):
+                return
+            # Drop the journal too, so discarded updates are not replayed
+            # on the next start (closing still goes ahead if that fails)
+            try:
+                self._clear_journal()
+            except OSError:
+                pass
+        elif self._journal is not None:
+            self._journal.close()
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+        self.root.destroy()
     
     def create_widgets(self):
         """Create the GUI interface with output at top and buttons below"""
@@ -156,6 +339,11 @@ class StudentManager:
         self.output_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Status bar along the very bottom for success messages, which are
+        # shown without a modal dialog (errors still use message boxes)
+        self.status_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.status_var, anchor=tk.W).pack(side=tk.BOTTOM, fill=tk.X)
+        
         # Buttons frame at the BOTTOM (user actions)
         button_frame = ttk.LabelFrame(main_frame, text="Menu Options", padding="10")
         button_frame.pack(fill=tk.X, pady=10)
@@ -176,6 +364,10 @@ class StudentManager:
         self.student_code_entry = ttk.Entry(middle_frame, width=10, font=("Arial", 12))
         self.student_code_entry.pack(pady=5)
         
+        # Explicit save for edits that are only held in memory
+        ttk.Button(middle_frame, text="Save to File", 
+                command=self.save_to_file, width=14).pack(pady=(15, 5))
+        
         # RIGHT SIDE: Buttons 5-8 (extension tasks)
         right_buttons_frame = ttk.Frame(center_frame)
         right_buttons_frame.pack(side=tk.LEFT, padx=10)
@@ -206,26 +398,41 @@ class StudentManager:
         ttk.Button(right_buttons_frame, text="8. Update Student", 
                 command=self.update_student, width=20).pack(padx=5, pady=5)
     
+    def show_status(self, message):
+        """Show a message in the status bar and clear it after a short delay"""
+        self.status_var.set(message)
+        # Restart the timer so a new message gets its full time on screen
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+        self._status_after = self.root.after(self.STATUS_CLEAR_MS, self._clear_status)
+    
+    def _clear_status(self):
+        self._status_after = None
+        self.status_var.set("")
+    
     def clear_output(self):
         """Clear the output text area"""
         self.output_text.delete(1.0, tk.END)
     
-    def display_student_info(self, student):
-        """Display information for a single student"""
-        total_coursework = sum(student['course_marks'])
-        percentage = self.calculate_percentage(student)
-        grade = self.get_grade(percentage)
-        
-        # Format student details as readable text and append to output
-        info = (f"Name: {student['name']}\n"
-                f"Student Code: {student['code']}\n"
-                f"Total Coursework: {total_coursework}/60\n"
-                f"Exam Mark: {student['exam_mark']}/100\n"
-                f"Overall Percentage: {percentage:.1f}%\n"
-                f"Grade: {grade}\n"
-                f"{'-'*40}\n")
-        
-        self.output_text.insert(tk.END, info)
+    def format_student_info(self, student):
+        """Return the display text for a single student"""
+        # The text is formatted once and cached on the record until it changes
+        if student.info is None:
+            # Format student details as readable text
+            # (totals, percentage and grade are cached on the Student record)
+            student.info = (f"Name: {student.name}\n"
+                            f"Student Code: {student.code}\n"
+                            f"Total Coursework: {student.total_coursework}/60\n"
+                            f"Exam Mark: {student.exam_mark}/100\n"
+                            f"Overall Percentage: {student.percentage:.1f}%\n"
+                            f"Grade: {student.grade}\n"
+                            f"{'-'*40}\n")
+        return student.info
+    
+    def display_student(self, title, student):
+        """Replace the output with a titled record for a single student"""
+        self.clear_output()
+        self.output_text.insert(tk.END, f"{title}\n{'='*50}\n\n{self.format_student_info(student)}")
     
     def view_all(self):
         """View all student records"""
@@ -235,20 +442,21 @@ class StudentManager:
             self.output_text.insert(tk.END, "No student records found.\n")
             return
         
-        self.output_text.insert(tk.END, "ALL STUDENT RECORDS\n")
-        self.output_text.insert(tk.END, "="*50 + "\n\n")
+        # Build the whole report first and insert it into the widget in one
+        # call, rather than one Tk insert per line or per student
+        parts = ["ALL STUDENT RECORDS\n", "="*50 + "\n\n"]
         
         # Display each student
-        for student in self.students:
-            self.display_student_info(student)
+        parts.extend(self.format_student_info(student) for student in self.students)
         
         # Calculate and display summary (average percentage across loaded students)
-        total_percentage = sum(self.calculate_percentage(student) for student in self.students)
+        total_percentage = sum(student.percentage for student in self.students)
         average_percentage = total_percentage / len(self.students)
         
-        self.output_text.insert(tk.END, f"\nSUMMARY:\n")
-        self.output_text.insert(tk.END, f"Number of students: {len(self.students)}\n")
-        self.output_text.insert(tk.END, f"Average percentage: {average_percentage:.2f}%\n")
+        parts.append(f"\nSUMMARY:\n"
+                     f"Number of students: {len(self.students)}\n"
+                     f"Average percentage: {average_percentage:.2f}%\n")
+        self.output_text.insert(tk.END, "".join(parts))
     
     def view_individual(self):
         """View individual student record"""
@@ -264,17 +472,10 @@ class StudentManager:
             return
         
         # Find the student
-        found_student = None
-        for student in self.students:
-            if student['code'] == code:
-                found_student = student
-                break
-        
-        if found_student:
-            self.clear_output()
-            self.output_text.insert(tk.END, "INDIVIDUAL STUDENT RECORD\n")
-            self.output_text.insert(tk.END, "="*50 + "\n\n")
-            self.display_student_info(found_student)
+        found_index = self._code_index.get(code)
+        
+        if found_index is not None:
+            self.display_student("INDIVIDUAL STUDENT RECORD", self.students[found_index])
         else:
             messagebox.showinfo("Not Found", f"No student found with code {code}")
     
@@ -285,13 +486,9 @@ class StudentManager:
             return
         
         # Find student with highest total marks (coursework + exam)
-        highest_student = max(self.students, 
-                            key=lambda s: sum(s['course_marks']) + s['exam_mark'])
+        highest_student = max(self.students, key=BY_TOTAL)
         
-        self.clear_output()
-        self.output_text.insert(tk.END, "STUDENT WITH HIGHEST SCORE\n")
-        self.output_text.insert(tk.END, "="*50 + "\n\n")
-        self.display_student_info(highest_student)
+        self.display_student("STUDENT WITH HIGHEST SCORE", highest_student)
     
     def show_lowest(self):
         """Show student with lowest overall mark"""
@@ -300,13 +497,9 @@ class StudentManager:
             return
         
         # Find student with lowest total marks (coursework + exam)
-        lowest_student = min(self.students, 
-                        key=lambda s: sum(s['course_marks']) + s['exam_mark'])
+        lowest_student = min(self.students, key=BY_TOTAL)
         
-        self.clear_output()
-        self.output_text.insert(tk.END, "STUDENT WITH LOWEST SCORE\n")
-        self.output_text.insert(tk.END, "="*50 + "\n\n")
-        self.display_student_info(lowest_student)
+        self.display_student("STUDENT WITH LOWEST SCORE", lowest_student)
     
     # EXTENSION TASK METHODS
     
@@ -322,17 +515,23 @@ class StudentManager:
                                     initialvalue="2")
         
         if order == "1":
-            self.students.sort(key=lambda s: self.calculate_percentage(s))
+            self.students.sort(key=BY_PERCENTAGE)
             order_text = "ascending"
         else:
-            self.students.sort(key=lambda s: self.calculate_percentage(s), reverse=True)
+            self.students.sort(key=BY_PERCENTAGE, reverse=True)
             order_text = "descending"
-        
-        # Save the sorted data back to the original file
-        if self.save_data():
-            # Display sorted results
-            self.view_all()
-            self.output_text.insert(tk.END, f"\n(Students sorted in {order_text} order by overall percentage)\n")
+        # Every student may have moved, so re-index all of them
+        self._rebuild_code_index()
+        
+        self.dirty = True
+        
+        # Save the sorted data back to the original file, then display it
+        def on_saved(saved):
+            if saved:
+                # Display sorted results
+                self.view_all()
+                self.output_text.insert(tk.END, f"\n(Students sorted in {order_text} order by overall percentage)\n")
+        self.save_data_async(on_saved)
     
     def add_student(self):
         """Add a new student record directly to the original file"""
@@ -369,9 +568,15 @@ class StudentManager:
         exam_entry.grid(row=5, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         def save_student():
+            # Same code rule as the update form: a plain whole number,
+            # optionally negative (int() alone would also take "1_0" or "+5")
+            raw_code = code_entry.get().strip()
+            if not raw_code.removeprefix('-').isdecimal():
+                messagebox.showerror("Error", "Please enter a valid whole number for Student Code.")
+                return
             try:
                 # Validate inputs - strip whitespace and convert to appropriate types
-                code = int(code_entry.get().strip())
+                code = int(raw_code)
                 name = name_entry.get().strip()
                 mark1 = int(mark1_entry.get())
                 mark2 = int(mark2_entry.get())
@@ -383,7 +588,8 @@ class StudentManager:
                     messagebox.showerror("Error", "Student name is required.")
                     return
                 
-                if mark1 < 0 or mark1 > 20 or mark2 < 0 or mark2 > 20 or mark3 < 0 or mark3 > 20:
+                marks = (mark1, mark2, mark3)
+                if min(marks) < 0 or max(marks) > 20:
                     messagebox.showerror("Error", "Coursework marks must be between 0 and 20.")
                     return
                 
@@ -392,24 +598,25 @@ class StudentManager:
                     return
                 
                 # Check if code already exists (prevent duplicate IDs)
-                if any(s['code'] == code for s in self.students):
+                if code in self._code_index:
                     messagebox.showerror("Error", "Student code already exists.")
                     return
                 
                 # Add new student record to the list
-                new_student = {
-                    'code': code,
-                    'name': name,
-                    'course_marks': [mark1, mark2, mark3],
-                    'exam_mark': exam
-                }
+                new_student = Student(code, name, mark1, mark2, mark3, exam)
                 
+                self._code_index[code] = len(self.students)
                 self.students.append(new_student)
-                # Save to original file and refresh display if successful
-                if self.save_data():
-                    add_window.destroy()
-                    messagebox.showinfo("Success", "Student added successfully to the original file.")
+                self.dirty = True
+                add_window.destroy()
+                
+                # Save to original file once the form has closed, then
+                # refresh the display (the new record is in memory either way)
+                def on_saved(saved):
+                    if saved:
+                        self.show_status("Student added successfully to the original file.")
                     self.view_all()  # Refresh display
+                self.save_data_async(on_saved)
                 
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numeric values.")
@@ -433,26 +640,30 @@ class StudentManager:
             return
         
         # Find the student by code
-        found_index = -1
-        for i, student in enumerate(self.students):
-            if student['code'] == code:
-                found_index = i
-                break
-        
-        if found_index != -1:
-            student_name = self.students[found_index]['name']
+        found_index = self._code_index.get(code)
+        
+        if found_index is not None:
+            student_name = self.students[found_index].name
             # Ask for confirmation before deleting
             if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {student_name} (Code: {code})?"):
                 deleted_student = self.students.pop(found_index)
-                # Save changes directly to original file and refresh display
-                if self.save_data():
-                    messagebox.showinfo("Success", f"Student {deleted_student['name']} deleted successfully.")
+                # Drop the deleted code and shift the students after it down one
+                # (a later student sharing the deleted code takes over its entry)
+                del self._code_index[code]
+                self._rebuild_code_index(found_index)
+                self.dirty = True
+                
+                # Save changes to original file, then refresh display
+                def on_saved(saved):
+                    if saved:
+                        self.show_status(f"Student {deleted_student.name} deleted successfully.")
                     self.view_all()  # Refresh display
+                self.save_data_async(on_saved)
         else:
             messagebox.showinfo("Not Found", f"No student found with code {code}")
     
     def update_student(self):
-        """Update a student record directly in the original file"""
+        """Update a student record in memory (saved by Save to File or on close)"""
         if not self.students:
             messagebox.showinfo("Info", "No student records available.")
             return
@@ -465,13 +676,9 @@ class StudentManager:
             return
         
         # Find the student by code
-        found_index = -1
-        for i, student in enumerate(self.students):
-            if student['code'] == code:
-                found_index = i
-                break
+        found_index = self._code_index.get(code)
         
-        if found_index == -1:
+        if found_index is None:
             messagebox.showinfo("Not Found", f"No student found with code {code}")
             return
         
@@ -479,7 +686,7 @@ class StudentManager:
         
         # Create a modal update form window with current student data pre-filled
         update_window = tk.Toplevel(self.root)
-        update_window.title(f"Update Student: {student['name']}")
+        update_window.title(f"Update Student: {student.name}")
         update_window.geometry("400x350")
         update_window.transient(self.root)
         update_window.grab_set()
@@ -487,84 +694,114 @@ class StudentManager:
         # Create form with current values pre-populated in entry fields
         ttk.Label(update_window, text="Student Code:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         code_entry = ttk.Entry(update_window)
-        code_entry.insert(0, str(student['code']))  # Pre-fill with current code
+        code_entry.insert(0, str(student.code))  # Pre-fill with current code
         code_entry.grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         ttk.Label(update_window, text="Student Name:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         name_entry = ttk.Entry(update_window)
-        name_entry.insert(0, student['name'])
+        name_entry.insert(0, student.name)
         name_entry.grid(row=1, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         ttk.Label(update_window, text="Coursework Mark 1 (0-20):").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
         mark1_entry = ttk.Entry(update_window)
-        mark1_entry.insert(0, str(student['course_marks'][0]))
+        mark1_entry.insert(0, str(student.mark1))
         mark1_entry.grid(row=2, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         ttk.Label(update_window, text="Coursework Mark 2 (0-20):").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
         mark2_entry = ttk.Entry(update_window)
-        mark2_entry.insert(0, str(student['course_marks'][1]))
+        mark2_entry.insert(0, str(student.mark2))
         mark2_entry.grid(row=3, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         ttk.Label(update_window, text="Coursework Mark 3 (0-20):").grid(row=4, column=0, padx=5, pady=5, sticky=tk.W)
         mark3_entry = ttk.Entry(update_window)
-        mark3_entry.insert(0, str(student['course_marks'][2]))
+        mark3_entry.insert(0, str(student.mark3))
         mark3_entry.grid(row=4, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         ttk.Label(update_window, text="Exam Mark (0-100):").grid(row=5, column=0, padx=5, pady=5, sticky=tk.W)
         exam_entry = ttk.Entry(update_window)
-        exam_entry.insert(0, str(student['exam_mark']))
+        exam_entry.insert(0, str(student.exam_mark))
         exam_entry.grid(row=5, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
         
-        def save_changes():
-            try:
-                # Validate inputs - extract and validate form data
-                new_code = int(code_entry.get().strip())
-                name = name_entry.get().strip()
-                mark1 = int(mark1_entry.get())
-                mark2 = int(mark2_entry.get())
-                mark3 = int(mark3_entry.get())
-                exam = int(exam_entry.get())
-                
-                # Validation checks (same as add_student)
-                if not name:
-                    messagebox.showerror("Error", "Student name is required.")
-                    return
-                
-                if mark1 < 0 or mark1 > 20 or mark2 < 0 or mark2 > 20 or mark3 < 0 or mark3 > 20:
-                    messagebox.showerror("Error", "Coursework marks must be between 0 and 20.")
-                    return
-                
-                if exam < 0 or exam > 100:
-                    messagebox.showerror("Error", "Exam mark must be between 0 and 100.")
-                    return
-                
-                # Check if new code already exists (excluding current student)
-                # This allows students to keep their code but prevents duplicates
-                if any(s['code'] == new_code and i != found_index for i, s in enumerate(self.students)):
-                    messagebox.showerror("Error", "Student code already exists.")
-                    return
-                
-                # Update the student record with new values
-                self.students[found_index] = {
-                    'code': new_code,
-                    'name': name,
-                    'course_marks': [mark1, mark2, mark3],
-                    'exam_mark': exam
-                }
-                
-                # Save changes directly to text file and refresh display if successful
-                if self.save_data():
-                    update_window.destroy()
-                    messagebox.showinfo("Success", "File has been updated successfully.")
-                    self.view_all()  # Refresh display
-                
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid student code.")
-        
-        ttk.Button(update_window, text="Save Changes", command=save_changes).grid(row=6, column=0, columnspan=2, pady=10)
+        # The save logic is a method rather than a closure redefined per dialog
+        entries = (code_entry, name_entry, mark1_entry, mark2_entry, mark3_entry, exam_entry)
+        ttk.Button(update_window, text="Save Changes", 
+                command=lambda: self._apply_update(update_window, *entries, found_index)
+                ).grid(row=6, column=0, columnspan=2, pady=10)
         
         # Configure grid weights
         update_window.columnconfigure(1, weight=1)
+    
+    def _set_student(self, found_index, new_code, name, mark1, mark2, mark3, exam):
+        """Overwrite the fields of the student at `found_index` and return it"""
+        # Update the existing record in place rather than allocating a new
+        # one, then recompute its cached totals (this also clears its text)
+        student = self.students[found_index]
+        code = student.code
+        student.code = new_code
+        student.name = name
+        student.mark1 = mark1
+        student.mark2 = mark2
+        student.mark3 = mark3
+        student.exam_mark = exam
+        student.refresh_totals()
+        # Re-key the index if the student's code was changed
+        if new_code != code:
+            del self._code_index[code]
+            self._code_index[new_code] = found_index
+            # A later student may share the old code; re-index so it is found
+            self._rebuild_code_index(found_index + 1)
+        return student
+    
+    def _apply_update(self, update_window, code_entry, name_entry, mark1_entry,
+                      mark2_entry, mark3_entry, exam_entry, found_index):
+        """Validate the update form and apply it to the student at `found_index`"""
+        code = self.students[found_index].code
+        # Each numeric field with the label used in error messages and its
+        # allowed range (None for no range check), in form order
+        fields = ((code_entry, "Student Code", None, None),
+                  (mark1_entry, "Coursework Mark 1", 0, 20),
+                  (mark2_entry, "Coursework Mark 2", 0, 20),
+                  (mark3_entry, "Coursework Mark 3", 0, 20),
+                  (exam_entry, "Exam Mark", 0, 100))
+        values = []
+        for entry, label, low, high in fields:
+            raw = entry.get().strip()
+            # Codes and marks are plain whole numbers, optionally negative
+            # (codes may be, as in the add form; marks are range-checked
+            # below). isdecimal rejects what int() alone lets through ("1_0", "+5")
+            if not raw.removeprefix('-').isdecimal():
+                # Name the field that failed rather than a generic message
+                messagebox.showerror("Error", f"Please enter a valid whole number for {label}.")
+                return
+            value = int(raw)
+            if low is not None and not low <= value <= high:
+                messagebox.showerror("Error", f"{label} must be between {low} and {high}.")
+                return
+            values.append(value)
+        new_code, mark1, mark2, mark3, exam = values
+        
+        name = name_entry.get().strip()
+        if not name:
+            messagebox.showerror("Error", "Student name is required.")
+            return
+        
+        # Check if new code already exists (excluding current student)
+        # This allows students to keep their code but prevents duplicates
+        if self._code_index.get(new_code, found_index) != found_index:
+            messagebox.showerror("Error", "Student code already exists.")
+            return
+        
+        student = self._set_student(found_index, new_code, name, mark1, mark2, mark3, exam)
+        
+        # The edit is kept in memory and journaled, and the data file is
+        # rewritten later by the Save button or on close, not per edit
+        self.dirty = True
+        self._journal_update(code, student)
+        update_window.destroy()
+        self.show_status("Student updated. Use 'Save to File' to write the changes.")
+        # Only this record changed, so show just it rather than
+        # re-rendering every student in the output area
+        self.display_student("UPDATED STUDENT RECORD", student)
 
 def main():
     # Standard Tkinter app runner: create the root window and start the event loop